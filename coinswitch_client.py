@@ -0,0 +1,377 @@
+import asyncio
+import logging
+import time
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.retry import Retry
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class _PrettyJSON:
+    """
+    Defers pretty-printing a response until a log handler actually formats it.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return orjson.dumps(self.obj, option=orjson.OPT_INDENT_2).decode()
+
+
+# --- CoinSwitchAPI Class ---
+class CoinSwitchAPI:
+    BASE_URL = "https://coinswitch.co"  # Base URL for the CoinSwitch API
+    METHOD_BYTES = {"GET": b"GET", "POST": b"POST", "DELETE": b"DELETE"}
+    __slots__ = (
+        "api_key",
+        "_debug",
+        "_timeout",
+        "_signing_key",
+        "_session",
+        "_price_cache",
+        "_price_cache_ttl_ns",
+        "_signers",
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        price_cache_ttl_ns: int = 1_000_000_000,
+        debug: bool = False,
+        connect_timeout: float = 2.0,
+        read_timeout: float = 10.0,
+    ):
+        """
+        Initialize the API client with the API key and secret key.
+        Prices fetched from candles are reused for price_cache_ttl_ns nanoseconds (default 1s).
+        Set debug=True to print DEBUG progress messages.
+        Connecting fails fast after connect_timeout seconds; reads may take up to read_timeout.
+        """
+        self.api_key = api_key
+        self._timeout = (connect_timeout, read_timeout)
+        self._debug = debug
+        # Parse the secret key once; the key object is reused for every signature
+        self._signing_key = ed25519.Ed25519PrivateKey.from_private_bytes(
+            bytes.fromhex(secret_key)
+        )
+
+        # Persistent session: keeps the TLS connection alive between requests
+        self._session = requests.Session()
+        self._session.verify = True  # Never send signed requests over unverified TLS
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,  # Every request goes to the single BASE_URL host
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504]
+                ),
+            ),
+        )
+        self._session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "X-AUTH-APIKEY": api_key,
+            }
+        )
+
+        # (symbol, exchange) -> (monotonic timestamp in ns, price)
+        self._price_cache: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        self._price_cache_ttl_ns = price_cache_ttl_ns
+
+        # (method, endpoint) -> signer with the message prefix and key prebound
+        self._signers: Dict[Tuple[str, str], Callable[..., str]] = {}
+
+    def _get_signer(self, method: str, endpoint: str) -> Callable[..., str]:
+        """
+        Returns a signing function prebound to the method, endpoint and signing key.
+        Signers are memoized per (method, endpoint), so the fixed part of the message
+        is encoded only once.
+        """
+        key = (method, endpoint)
+        signer = self._signers.get(key)
+        if signer is None:
+            sign = self._signing_key.sign
+            prefix = self.METHOD_BYTES[method] + endpoint.encode()
+
+            def signer(epoch: bytes, query: bytes = b'') -> str:
+                return sign(b''.join((prefix, query, epoch))).hex()
+
+            self._signers[key] = signer
+        return signer
+
+    def _generate_signature(
+        self,
+        method: str,
+        endpoint: str,
+        epoch_time: str,
+        params: Optional[Dict] = None,
+    ) -> str:
+        """
+        Generates the Ed25519 signature required for authenticated requests.
+        The message is method + endpoint (with the query string for GET) + epoch;
+        request bodies are not part of the signature.
+        """
+        try:
+            # Build the unencoded query string directly; requests encodes params itself
+            query = b''
+            if method == "GET" and params:
+                query = (
+                    ('&' if '?' in endpoint else '?')
+                    + '&'.join(f'{key}={value}' for key, value in params.items())
+                ).encode()
+
+            return self._get_signer(method, endpoint)(epoch_time.encode(), query)
+        except Exception as e:
+            raise ValueError(f"Error generating signature: {e}")
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        payload: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        Sends an HTTP request to the CoinSwitch API.
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+
+        # Generate the epoch time once and use it for both header and signature
+        epoch_time = str(time.time_ns() // 1_000_000)
+        try:
+            signature = self._generate_signature(method, endpoint, epoch_time, params)
+        except ValueError as e:
+            raise ValueError(f"Failed to generate signature: {e}")
+
+        try:
+            # Static headers live on the session; only the per-call auth headers are passed
+            response = self._session.request(
+                method=method,
+                url=url,
+                headers={"X-AUTH-SIGNATURE": signature, "X-AUTH-EPOCH": epoch_time},
+                params=params if method == "GET" else None,
+                json=payload if method in ("POST", "DELETE") else None,
+                timeout=self._timeout,
+            )
+            response.raise_for_status()  # Raise HTTPError for bad responses (4xx and 5xx)
+            return orjson.loads(response.content)
+        except requests.exceptions.RequestException as e:
+            raise ConnectionError(f"Request failed: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error during API request: {e}")
+
+    # --- API Methods ---
+    def get_account_balances(self) -> Dict:
+        """
+        Fetches the portfolio balances of the account.
+        """
+        endpoint = "/trade/api/v2/user/portfolio"
+        return self._send_request("GET", endpoint)
+
+    def get_historical_candles(
+        self, symbol: str, interval: str, start_time: int, end_time: int, exchange: str
+    ) -> Dict:
+        """
+        Fetches historical candle data for a cryptocurrency.
+        """
+        endpoint = "/trade/api/v2/candles"
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "start_time": start_time,
+            "end_time": end_time,
+            "exchange": exchange,
+        }
+        try:
+            return self._send_request("GET", endpoint, params=params)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch historical candles: {e}")
+
+    @staticmethod
+    def candles_to_arrays(response: Dict) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Converts a candles response into (start_time, close_price) NumPy arrays.
+        Start times are epoch milliseconds (int64); close prices are float64.
+        """
+        import numpy as np  # Imported here so only the array helpers need NumPy
+
+        data = response["data"]
+        start_times = np.fromiter(
+            (int(candle["start_time"]) for candle in data), dtype=np.int64, count=len(data)
+        )
+        close_prices = np.fromiter(
+            (float(candle["c"]) for candle in data), dtype=np.float64, count=len(data)
+        )
+        return start_times, close_prices
+
+    @staticmethod
+    def portfolio_to_soa(portfolio_data: Dict) -> Dict[str, Union[List[str], "np.ndarray"]]:
+        """
+        Converts a portfolio response into parallel arrays: currency codes plus main and blocked balances.
+        Totals and filters become single NumPy calls, e.g. soa["main"].sum() or soa["main"][soa["main"] > 0].
+        """
+        import numpy as np  # Imported here so only the array helpers need NumPy
+
+        data = portfolio_data["data"]
+        currencies = [entry.get("currency", "") for entry in data]
+        main = np.fromiter(
+            (float(entry.get("main_balance", 0)) for entry in data), dtype=np.float64, count=len(data)
+        )
+        blocked = np.fromiter(
+            (float(entry.get("blocked_balance_order", 0)) for entry in data), dtype=np.float64, count=len(data)
+        )
+        return {"currency": currencies, "main": main, "blocked": blocked}
+
+    def get_current_price_from_candle(
+        self, symbol: str, exchange: str
+    ) -> Optional[float]:
+        """
+        Fetches the current approximate price of a symbol using the latest 1-minute candle.
+        This uses the historical candles endpoint as a proxy for a real-time ticker.
+        Returns None if price cannot be fetched.
+        Back-to-back calls for the same symbol and exchange return the cached price.
+        """
+        cache_key = (symbol, exchange)
+        cached = self._price_cache.get(cache_key)
+        if cached and time.monotonic_ns() - cached[0] < self._price_cache_ttl_ns:
+            return cached[1]
+
+        try:
+            end_time_ms = time.time_ns() // 1_000_000
+            # Request data for the last 5 minutes (to be safe and get at least one candle)
+            start_time_ms = end_time_ms - (5 * 60 * 1000)  # 5 minutes ago
+
+            if self._debug:
+                print(
+                    f"DEBUG: Attempting to fetch latest 1-min candle for {symbol} on {exchange} "
+                    f"(from {start_time_ms} to {end_time_ms})..."
+                )
+            candles_response = self.get_historical_candles(
+                symbol=symbol,
+                interval="1",  # 1-minute interval for the most recent data
+                start_time=start_time_ms,
+                end_time=end_time_ms,
+                exchange=exchange,
+            )
+
+            # Serialized only if a DEBUG-level handler is enabled
+            logger.debug(
+                "Raw candles_response received:\n%s", _PrettyJSON(candles_response)
+            )
+            if (
+                candles_response
+                and "data" in candles_response
+                and isinstance(candles_response["data"], list)
+                and candles_response["data"] # Check if the list is non-empty
+            ):
+                # The API typically returns candles in reverse chronological order (newest first)
+                latest_candle = candles_response["data"][0] # CORRECTED: Access "data" key
+                close_price_str = latest_candle.get("c")
+                if close_price_str:
+                    price = float(close_price_str)
+                    self._price_cache[cache_key] = (time.monotonic_ns(), price)
+                    if self._debug:
+                        print(
+                            f"DEBUG: Latest approximate close price from candle for {symbol}: {price}"
+                        )
+                    return price
+                else:
+                    print(
+                        f"WARNING: 'c' (close price) key not found in latest candle, "
+                        f"or its value is empty for {symbol}. Latest candle data: {orjson.dumps(latest_candle, option=orjson.OPT_INDENT_2).decode()}"
+                    )
+            else:
+                print(
+                    f"WARNING: No valid candle data (empty 'data' list or missing 'data' key) "
+                    f"found for {symbol} in response."
+                )
+            return None
+        except Exception as e:
+            print(f"ERROR: Failed to get current price from candle for {symbol}: {e}")
+            return None
+
+    def get_prices(
+        self, symbols: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Optional[float]]:
+        """
+        Fetches the current approximate price of several (symbol, exchange) pairs in parallel.
+        The lookups share the client's session, so they overlap on its connection pool.
+        Pairs whose price cannot be fetched map to None.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(self.get_current_price_from_candle, symbol, exchange): (
+                    symbol,
+                    exchange,
+                )
+                for symbol, exchange in symbols
+            }
+            return {pair: future.result() for future, pair in futures.items()}
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,  # MUST be 'LIMIT' as per docs (Page 15)
+        quantity: float,
+        exchange: str,
+        price: float,  # Price is MANDATORY for 'LIMIT' orders (Page 15)
+    ) -> Dict:
+        """
+        Places a buy or sell order.
+        Note: CoinSwitch API currently supports only 'LIMIT' order type for direct placement.
+        """
+        endpoint = "/trade/api/v2/order"
+        payload = {
+            "side": side,
+            "symbol": symbol,
+            "type": order_type,  # Explicitly using 'LIMIT' as required by docs
+            "quantity": quantity,
+            "exchange": exchange,
+            "price": price,  # Mandatory for LIMIT orders
+        }
+        try:
+            print("Placing order payload:", payload)
+            return self._send_request("POST", endpoint, payload=payload)
+        except Exception as e:
+            raise RuntimeError(f"Failed to place order: {e}")
+
+    def get_order_details(self, order_id: str) -> Dict:
+        """
+        Fetches details of a specific order.
+        """
+        endpoint = "/trade/api/v2/order"
+        params = {"order_id": order_id}
+        try:
+            return self._send_request("GET", endpoint, params=params)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch order details: {e}")
+
+
+# --- Concurrent Price Fetching ---
+async def fetch_current_prices(
+    api_client: CoinSwitchAPI, symbols: List[str], exchange: str
+) -> Dict[str, Optional[float]]:
+    """
+    Awaitable wrapper over CoinSwitchAPI.get_prices for asyncio callers.
+    The lookups run on get_prices' bounded thread pool, without blocking the event loop. Usage:
+        prices = asyncio.run(fetch_current_prices(api_client, ["BTC/INR", "ETH/INR"], "coinswitchx"))
+    """
+    loop = asyncio.get_running_loop()
+    prices = await loop.run_in_executor(
+        None, api_client.get_prices, [(symbol, exchange) for symbol in symbols]
+    )
+    return {symbol: prices[(symbol, exchange)] for symbol in symbols}